@@ -407,6 +407,10 @@ PIPE_TOP_IMG = pygame.transform.flip(PIPE_BOTTOM_IMG, False, True)
 PIPE_BOTTOM_HEIGHTS = [90, 122, 154, 186, 218, 250]
 PIPE_SPEED = 3  # Added constant for pipe speed
 
+# AI decision settings
+FLAP_COOLDOWN = 10  # Frames during which further flaps are ignored
+DECISION_INTERVAL = 1  # AI birds query their network every N frames (1 = every frame)
+
 # Global variables
 GEN = 0
 HUMAN_MODE = False
@@ -438,7 +442,7 @@ class Bird:
     def move(self, jump=False):
         if jump and self.flap_cooldown <= 0:
             self.velocity = JUMP_SPEED
-            self.flap_cooldown = 10  # Set cooldown frames
+            self.flap_cooldown = FLAP_COOLDOWN  # Set cooldown frames
         
         # Apply gravity and update position
         self.velocity = min(self.velocity + GRAVITY, MAX_FALL_SPEED)
@@ -448,6 +452,10 @@ class Bird:
         if self.flap_cooldown > 0:
             self.flap_cooldown -= 1
 
+    def can_decide(self, frame):
+        # A flap during cooldown is ignored, so only decide when it can take effect
+        return self.flap_cooldown <= 0 and frame % DECISION_INTERVAL == 0
+
     def collision(self, pipes):
         for pipe in pipes:
             if self.bird_rect.colliderect(pipe.bottom_pipe_rect) or \
@@ -568,6 +576,7 @@ def ai_game(genomes, config):
     ge = []
     pipes = []
     start_time = pygame.time.get_ticks()
+    frame = 0
 
     for _, genome in genomes[:20]:  # Increased to 20 birds
         net = neat.nn.FeedForwardNetwork.create(genome, config)
@@ -598,12 +607,16 @@ def ai_game(genomes, config):
         alive_birds = 0
         for i, bird in enumerate(birds):
             if not bird.dead:
-                if pipes:
-                    output = nets[i].activate([bird.bird_rect.y, pipes[0].top_pipe_rect.x, bird.bird_rect.y - (pipes[0].bottom_pipe_rect.top - GAP_PIPE / 2)])
-                else:
-                    output = nets[i].activate([bird.bird_rect.y, BG_WIDTH, 0])
-
-                bird.move(jump=output[0] > 0.5)
+                jump = False
+                if bird.can_decide(frame):
+                    if pipes:
+                        output = nets[i].activate([bird.bird_rect.y, pipes[0].top_pipe_rect.x, bird.bird_rect.y - (pipes[0].bottom_pipe_rect.top - GAP_PIPE / 2)])
+                    else:
+                        output = nets[i].activate([bird.bird_rect.y, BG_WIDTH, 0])
+                    jump = output[0] > 0.5
+
+                # Physics still steps every frame, even when no decision is made
+                bird.move(jump=jump)
                 bird.score += SCORE_INCREASE
                 ge[i].fitness += SCORE_INCREASE
                 WN.blit(BIRD_IMG, bird.bird_rect)
@@ -626,6 +639,7 @@ def ai_game(genomes, config):
             WN.blit(text, (10, 10 + idx * 30))
 
         pygame.display.update()
+        frame += 1
         CLOCK.tick(FPS)
 
 